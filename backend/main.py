@@ -5,6 +5,9 @@ Smart Plantation Planning backend for hackathon demo.
 Run with: uvicorn main:app --reload --port 8000
 """
 
+import asyncio
+from contextlib import asynccontextmanager, suppress
+
 from fastapi import FastAPI
 from fastapi.middleware.cors import CORSMiddleware
 from fastapi.staticfiles import StaticFiles
@@ -13,6 +16,28 @@ from pathlib import Path
 
 from models.schemas import HealthResponse
 from routers import land, crops, plantation, nurseries, bookings, weather, water
+from services.catalog import catalog
+
+# ─── Lifespan (background tasks) ──────────────────────────────
+
+@asynccontextmanager
+async def lifespan(app: FastAPI):
+    """
+    Start background tasks for the app's lifetime:
+    - reference catalog hot reload
+    - weather prefetch for hot tiles (live weather only)
+    """
+    catalog.reload_if_changed()  # load reference data before serving traffic
+    tasks = [asyncio.create_task(catalog.watch())]
+    if weather.prefetcher.enabled:
+        tasks.append(asyncio.create_task(weather.prefetcher.run()))
+    yield
+    for task in tasks:
+        task.cancel()
+    for task in tasks:
+        with suppress(asyncio.CancelledError):
+            await task
+
 
 # ─── App Setup ────────────────────────────────────────────────
 
@@ -22,6 +47,7 @@ app = FastAPI(
     version="hackathon-v1",
     docs_url="/docs",       # Swagger UI
     redoc_url="/redoc",     # ReDoc
+    lifespan=lifespan,
 )
 
 # ─── CORS (allow all origins for hackathon) ───────────────────
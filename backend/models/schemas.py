@@ -123,6 +123,20 @@ class WeatherResponse(BaseModel):
     condition: str
 
 
+class PrefetchStats(BaseModel):
+    enabled: bool
+    tracked_tiles: int
+    requests: int
+    misses: int
+    prefetch_hits: int
+    prefetch_hit_ratio: float
+    prefetches: int
+    prefetch_errors: int
+    skipped_for_budget: int
+    budget_per_minute: int
+    budget_used_last_minute: int
+
+
 # ─── Water ────────────────────────────────────────────────────
 
 class WaterRequest(BaseModel):
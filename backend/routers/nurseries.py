@@ -3,20 +3,14 @@ Router: Nursery Locator.
 GET /nurseries/nearby — Find nurseries within radius, optionally filtered by crop.
 """
 
-import json
-from pathlib import Path
 from typing import Optional
 from fastapi import APIRouter, Query
 from models.schemas import NurseryResponse, NurseryItem
+from services.catalog import catalog
 from services.geo import haversine_distance
 
 router = APIRouter(prefix="/nurseries", tags=["Nurseries"])
 
-# Load nursery data once
-_DATA_PATH = Path(__file__).resolve().parent.parent / "data" / "nurseries.json"
-with open(_DATA_PATH, "r") as f:
-    _NURSERIES_DATA = json.load(f)["nurseries"]
-
 
 @router.get("/nearby", response_model=NurseryResponse)
 async def nearby_nurseries(
@@ -29,30 +23,32 @@ async def nearby_nurseries(
     Return nurseries within the given radius of the user's location.
     Optionally filter by crop availability.
     """
+    snapshot = catalog.snapshot
+    crop_id = crop.lower() if crop else None
+
+    # If crop filter is specified, only nurseries stocking it are candidates
+    if crop_id:
+        candidates = snapshot.nurseries_by_crop.get(crop_id, ())
+    else:
+        candidates = snapshot.nurseries
+
     results = []
-    for n in _NURSERIES_DATA:
-        dist = haversine_distance(lat, lng, n["lat"], n["lng"])
+    for n in candidates:
+        dist = haversine_distance(lat, lng, n.lat, n.lng)
         if dist > radius_km:
             continue
 
-        # If crop filter is specified, check inventory
-        if crop and crop.lower() not in {k.lower() for k in n["inventory"]}:
-            continue
-
-        # Sum available plants (all crops or specific crop)
-        if crop:
-            available = n["inventory"].get(crop.lower(), 0)
-        else:
-            available = sum(n["inventory"].values())
+        # Available plants (specific crop or all crops)
+        available = n.inventory[crop_id] if crop_id else n.total_plants
 
         results.append(NurseryItem(
-            id=n["id"],
-            name=n["name"],
-            lat=n["lat"],
-            lng=n["lng"],
+            id=n.id,
+            name=n.name,
+            lat=n.lat,
+            lng=n.lng,
             distance_km=round(dist, 2),
             available_plants=available,
-            contact=n["contact"]
+            contact=n.contact
         ))
 
     # Sort by distance
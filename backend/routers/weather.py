@@ -1,28 +1,41 @@
 """
 Router: Weather (cached, with mock fallback).
 GET /weather — Return weather for given lat/lng.
+GET /weather/prefetch — Background prefetch hit ratio and upstream budget use.
 
 Requires OPENWEATHER_API_KEY env var for real data.
 Falls back to realistic mock data if key is not set — perfect for demos.
+With live data enabled, hot tiles are refreshed in the background before
+their cache entries expire (see services/prefetch.py).
 """
 
 import os
 import random
 from fastapi import APIRouter, Query
-from models.schemas import WeatherResponse
+from models.schemas import WeatherResponse, PrefetchStats
 from services.cache import weather_cache
+from services.prefetch import UpstreamBudget, WeatherPrefetcher
 
 router = APIRouter(tags=["Weather"])
 
 # Optional: set OPENWEATHER_API_KEY in your environment for live data
 _API_KEY = os.environ.get("OPENWEATHER_API_KEY")
 
+# Override to point at a local mock upstream (e.g. utils/mock_upstream.py)
+_BASE_URL = os.environ.get("OPENWEATHER_BASE_URL", "https://api.openweathermap.org")
+
+# Upstream calls allowed per minute (OpenWeather free tier is 60)
+_RATE_LIMIT = int(os.environ.get("OPENWEATHER_RPM", "60"))
+
+# Cache weather for 10 minutes (600 seconds)
+_CACHE_TTL = 600
+
 
 async def _fetch_live_weather(lat: float, lng: float) -> dict:
     """Call OpenWeatherMap API for current weather."""
     import httpx
     url = (
-        f"https://api.openweathermap.org/data/2.5/weather"
+        f"{_BASE_URL}/data/2.5/weather"
         f"?lat={lat}&lon={lng}&appid={_API_KEY}&units=metric"
     )
     async with httpx.AsyncClient() as client:
@@ -49,6 +62,18 @@ def _mock_weather() -> dict:
     }
 
 
+# Background refresher for hot tiles — only useful with a live upstream.
+# Uses the live fetch directly: a failed refresh leaves the cached entry alone.
+prefetcher = WeatherPrefetcher(
+    cache=weather_cache,
+    fetch=_fetch_live_weather,
+    budget=UpstreamBudget(per_minute=_RATE_LIMIT),
+    ttl_seconds=_CACHE_TTL,
+    concurrency=int(os.environ.get("WEATHER_PREFETCH_CONCURRENCY", "4")),
+    enabled=bool(_API_KEY),
+)
+
+
 @router.get("/weather", response_model=WeatherResponse)
 async def get_weather(
     lat: float = Query(..., description="Latitude"),
@@ -63,11 +88,18 @@ async def get_weather(
 
     # Check cache first
     cached = weather_cache.get(cache_key)
+    prefetcher.record_request(cache_key, round(lat, 2), round(lng, 2), hit=bool(cached))
     if cached:
         return WeatherResponse(**cached)
 
+    # A background refresh for this tile is already running — share its result
+    data = await prefetcher.wait_in_flight(cache_key)
+    if data:
+        return WeatherResponse(**data)
+
     # Fetch weather (live or mock)
     if _API_KEY:
+        prefetcher.budget.record()
         try:
             data = await _fetch_live_weather(lat, lng)
         except Exception:
@@ -76,7 +108,17 @@ async def get_weather(
     else:
         data = _mock_weather()
 
-    # Cache for 10 minutes (600 seconds)
-    weather_cache.set(cache_key, data, ttl_seconds=600)
+    weather_cache.set(cache_key, data, ttl_seconds=_CACHE_TTL)
+    prefetcher.record_fetch(cache_key)
 
     return WeatherResponse(**data)
+
+
+@router.get("/weather/prefetch", response_model=PrefetchStats)
+async def get_prefetch_stats():
+    """
+    Report how well background prefetch is working.
+    prefetch_hit_ratio = share of /weather requests answered from an entry
+    the prefetcher refreshed (i.e. requests that skipped an upstream wait).
+    """
+    return PrefetchStats(**prefetcher.stats())
@@ -24,6 +24,14 @@ class TTLCache:
             del self._store[key]
         return None
 
+    def expires_in(self, key: str) -> Optional[float]:
+        """Return seconds until the key expires, or None if missing/expired."""
+        if key in self._store:
+            remaining = self._store[key][1] - time.time()
+            if remaining > 0:
+                return remaining
+        return None
+
     def set(self, key: str, value: Any, ttl_seconds: int = 600) -> None:
         """Store a value with a TTL (default 10 minutes)."""
         self._store[key] = (value, time.time() + ttl_seconds)
@@ -0,0 +1,195 @@
+"""
+Reference-data catalog.
+Loads crops.json and nurseries.json once into indexed, read-only snapshots
+shared by every router, and hot-reloads them when the files change on disk.
+
+Readers grab `catalog.snapshot` and use it for the whole request; a reload
+builds a brand-new snapshot off the event loop and swaps the reference in a
+single assignment, so requests never see a half-loaded catalog.
+"""
+
+import asyncio
+import json
+import logging
+import os
+from dataclasses import dataclass
+from pathlib import Path
+from types import MappingProxyType
+from typing import Any, Dict, List, Mapping, Optional, Tuple
+
+from models.schemas import CropItem
+
+logger = logging.getLogger(__name__)
+
+_DATA_DIR = Path(__file__).resolve().parent.parent / "data"
+
+# Poll interval for detecting changed data files (seconds)
+_RELOAD_INTERVAL = float(os.environ.get("CATALOG_RELOAD_SECONDS", "2"))
+
+
+def _freeze(value: Any) -> Any:
+    """Recursively convert dicts/lists into read-only mappings/tuples."""
+    if isinstance(value, dict):
+        return MappingProxyType({k: _freeze(v) for k, v in value.items()})
+    if isinstance(value, list):
+        return tuple(_freeze(v) for v in value)
+    return value
+
+
+@dataclass(frozen=True)
+class Nursery:
+    """One nursery with its inventory keyed by lowercase crop id."""
+    id: str
+    name: str
+    lat: float
+    lng: float
+    contact: str
+    inventory: Mapping[str, int]
+    total_plants: int
+
+
+@dataclass(frozen=True)
+class CatalogSnapshot:
+    """Immutable, pre-indexed view of all reference data."""
+    crops: Tuple[Mapping[str, Any], ...]
+    crops_by_id: Mapping[str, Mapping[str, Any]]       # lowercase id -> crop
+    nurseries: Tuple[Nursery, ...]
+    nurseries_by_id: Mapping[str, Nursery]
+    nurseries_by_crop: Mapping[str, Tuple[Nursery, ...]]  # lowercase crop -> nurseries stocking it
+
+
+def _validate_nursery(n: Any) -> None:
+    """Raise ValueError if a raw nursery record is missing fields or mistyped."""
+    if not isinstance(n, dict):
+        raise ValueError(f"Nursery record must be an object, got {type(n).__name__}")
+    for name in ("id", "name", "contact"):
+        if not isinstance(n.get(name), str):
+            raise ValueError(f"Nursery {n.get('id')!r}: '{name}' must be a string")
+    for name in ("lat", "lng"):
+        value = n.get(name)
+        if isinstance(value, bool) or not isinstance(value, (int, float)):
+            raise ValueError(f"Nursery {n['id']!r}: '{name}' must be a number")
+    inventory = n.get("inventory")
+    if not isinstance(inventory, dict) or not all(
+        isinstance(crop, str) and isinstance(count, int) and not isinstance(count, bool)
+        for crop, count in inventory.items()
+    ):
+        raise ValueError(f"Nursery {n['id']!r}: 'inventory' must map crop names to integers")
+
+
+def _build_snapshot(crops_raw: List[dict], nurseries_raw: List[dict]) -> CatalogSnapshot:
+    """
+    Validate, normalize and index raw JSON records into a CatalogSnapshot.
+
+    Raises ValueError (incl. pydantic's ValidationError) on records that
+    don't match the schema the routers serve, so a bad file never replaces
+    a good snapshot.
+    """
+    # Serve the validated (type-coerced) data, not the raw JSON
+    crops = tuple(_freeze(CropItem.model_validate(c).model_dump()) for c in crops_raw)
+    for n in nurseries_raw:
+        _validate_nursery(n)
+
+    crops_by_id = {c["id"].lower(): c for c in crops}
+
+    nurseries = []
+    by_crop: Dict[str, List[Nursery]] = {}
+    for n in nurseries_raw:
+        inventory: Dict[str, int] = {}
+        for crop, count in n["inventory"].items():
+            key = crop.lower()
+            inventory[key] = inventory.get(key, 0) + count
+        nursery = Nursery(
+            id=n["id"],
+            name=n["name"],
+            lat=n["lat"],
+            lng=n["lng"],
+            contact=n["contact"],
+            inventory=MappingProxyType(inventory),
+            total_plants=sum(inventory.values()),
+        )
+        nurseries.append(nursery)
+        for crop in inventory:
+            by_crop.setdefault(crop, []).append(nursery)
+
+    return CatalogSnapshot(
+        crops=crops,
+        crops_by_id=MappingProxyType(crops_by_id),
+        nurseries=tuple(nurseries),
+        nurseries_by_id=MappingProxyType({n.id: n for n in nurseries}),
+        nurseries_by_crop=MappingProxyType({k: tuple(v) for k, v in by_crop.items()}),
+    )
+
+
+class ReferenceCatalog:
+    """Holds the current CatalogSnapshot and reloads it when source files change."""
+
+    def __init__(self, crops_path: Path, nurseries_path: Path):
+        self._crops_path = crops_path
+        self._nurseries_path = nurseries_path
+        self._snapshot: Optional[CatalogSnapshot] = None
+        # (mtime_ns, size) per file for the currently loaded snapshot
+        self._signature: Optional[Tuple[Tuple[int, int], ...]] = None
+        # Signature of the last version that failed to load (not retried until it changes)
+        self._failed_signature: Optional[Tuple[Tuple[int, int], ...]] = None
+
+    @property
+    def snapshot(self) -> CatalogSnapshot:
+        """Current snapshot (loaded on first access)."""
+        if self._snapshot is None:
+            self.reload_if_changed()
+        return self._snapshot
+
+    def _file_signature(self) -> Tuple[Tuple[int, int], ...]:
+        stats = (os.stat(self._crops_path), os.stat(self._nurseries_path))
+        return tuple((s.st_mtime_ns, s.st_size) for s in stats)
+
+    def reload_if_changed(self) -> bool:
+        """
+        Rebuild the snapshot if either data file changed since the last load.
+
+        A file that fails to parse or validate (e.g. caught mid-write) keeps
+        the previous snapshot in place and is retried once the file changes again.
+
+        Returns:
+            True if a new snapshot was swapped in.
+        """
+        signature = self._file_signature()
+        if signature in (self._signature, self._failed_signature):
+            return False
+
+        try:
+            with open(self._crops_path, "r") as f:
+                crops_raw = json.load(f)["crops"]
+            with open(self._nurseries_path, "r") as f:
+                nurseries_raw = json.load(f)["nurseries"]
+            snapshot = _build_snapshot(crops_raw, nurseries_raw)
+        except (OSError, ValueError, KeyError, TypeError):
+            if self._snapshot is None:
+                raise
+            logger.exception("Catalog reload failed; keeping previous data")
+            self._failed_signature = signature
+            return False
+
+        # Single reference swap — readers see either the old or the new snapshot
+        self._snapshot = snapshot
+        self._signature = signature
+        return True
+
+    async def watch(self, interval: float = _RELOAD_INTERVAL) -> None:
+        """Poll the data files forever, reloading in a worker thread on change."""
+        while True:
+            await asyncio.sleep(interval)
+            try:
+                if await asyncio.to_thread(self.reload_if_changed):
+                    logger.info("Reference catalog reloaded")
+            except Exception:
+                # Keep polling — a dead watcher would silently stop hot reload
+                logger.exception("Catalog reload check failed")
+
+
+# Global singleton instance
+catalog = ReferenceCatalog(
+    crops_path=_DATA_DIR / "crops.json",
+    nurseries_path=_DATA_DIR / "nurseries.json",
+)
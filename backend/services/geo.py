@@ -2,15 +2,20 @@
 Geospatial calculation utilities.
 - Geodesic polygon area using pyproj
 - Haversine distance between two GPS points
+
+pyproj is imported on first use to keep app startup fast.
 """
 
 import math
+from functools import lru_cache
 from typing import List, Tuple
-from pyproj import Geod
 
 
-# WGS84 ellipsoid for accurate geodesic calculations
-_geod = Geod(ellps="WGS84")
+@lru_cache(maxsize=None)
+def _get_geod():
+    """WGS84 ellipsoid for accurate geodesic calculations (built lazily)."""
+    from pyproj import Geod
+    return Geod(ellps="WGS84")
 
 
 def calculate_geodesic_area(coordinates: List[List[float]]) -> float:
@@ -29,7 +34,7 @@ def calculate_geodesic_area(coordinates: List[List[float]]) -> float:
 
     # polygon_area_perimeter returns (area_m2, perimeter_m)
     # area is signed (positive = counter-clockwise), so we take abs
-    area, _ = _geod.polygon_area_perimeter(lons, lats)
+    area, _ = _get_geod().polygon_area_perimeter(lons, lats)
     return abs(area)
 
 
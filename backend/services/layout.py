@@ -1,12 +1,11 @@
 """
 Plantation layout generator.
 Creates a regular grid of planting points that fall inside a given polygon.
-Uses Shapely for robust point-in-polygon testing.
+Uses Shapely for robust point-in-polygon testing (imported on first use).
 """
 
 import math
 from typing import List, Dict
-from shapely.geometry import Polygon, Point
 
 
 def _offset_lat(lat: float, meters: float) -> float:
@@ -37,6 +36,8 @@ def generate_layout(polygon_coords: List[List[float]], spacing_m: float) -> Dict
         2. Generate a grid of candidate points with the specified spacing.
         3. Keep only points that fall inside the polygon (Shapely).
     """
+    from shapely.geometry import Polygon, Point
+
     # Shapely uses (x, y) = (lng, lat)
     shapely_coords = [(coord[1], coord[0]) for coord in polygon_coords]
     poly = Polygon(shapely_coords)
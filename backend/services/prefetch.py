@@ -0,0 +1,268 @@
+"""
+Background weather prefetch.
+Tracks which weather cache tiles are actually requested and refreshes the
+hottest ones shortly before they expire, so users rarely wait on the
+upstream API. Tiles that stop being requested go cold and are dropped.
+
+All upstream calls (user-triggered and prefetch) are counted against one
+requests-per-minute budget; prefetch only spends what is left after a
+reserve for user traffic.
+"""
+
+import asyncio
+import logging
+import random
+import time
+from collections import deque
+from dataclasses import dataclass, field
+from typing import Awaitable, Callable, Deque, Dict, Optional, Set
+
+from services.cache import TTLCache
+
+logger = logging.getLogger(__name__)
+
+
+class UpstreamBudget:
+    """Sliding one-minute window of upstream API calls."""
+
+    def __init__(self, per_minute: int, reserve_fraction: float = 0.2):
+        self.per_minute = per_minute
+        # Share of the budget prefetch must leave untouched for user requests
+        self.reserve = int(per_minute * reserve_fraction)
+        self._calls: Deque[float] = deque()
+
+    def _trim(self) -> None:
+        cutoff = time.time() - 60
+        while self._calls and self._calls[0] <= cutoff:
+            self._calls.popleft()
+
+    def used(self) -> int:
+        """Number of upstream calls made in the last 60 seconds."""
+        self._trim()
+        return len(self._calls)
+
+    def record(self) -> None:
+        """Count a user-triggered call (never refused)."""
+        self._calls.append(time.time())
+
+    def try_acquire(self) -> bool:
+        """Reserve one call for prefetch if the budget (minus reserve) allows it."""
+        if self.used() >= self.per_minute - self.reserve:
+            return False
+        self._calls.append(time.time())
+        return True
+
+
+@dataclass
+class _Tile:
+    lat: float
+    lng: float
+    score: float = 0.0          # exponentially decayed request count
+    last_seen: float = field(default_factory=time.time)
+    jitter: float = 0.0         # extra refresh lead for this tile's current entry
+    failures: int = 0           # consecutive failed refreshes
+    next_attempt: float = 0.0   # no refresh before this time (backoff after failures)
+    deferred: bool = False      # current entry already counted as skipped for budget
+
+
+class WeatherPrefetcher:
+    """Refreshes hot weather cache tiles ahead of expiry."""
+
+    def __init__(
+        self,
+        cache: TTLCache,
+        fetch: Callable[[float, float], Awaitable[dict]],
+        budget: UpstreamBudget,
+        ttl_seconds: int = 600,
+        interval: float = 10.0,
+        lead_seconds: float = 60.0,
+        jitter_seconds: float = 30.0,
+        concurrency: int = 4,
+        half_life: float = 600.0,
+        min_score: float = 2.0,
+        cold_after: float = 1800.0,
+        max_tiles: int = 500,
+        max_backoff: float = 600.0,
+        enabled: bool = True,
+    ):
+        self.enabled = enabled
+        self._cache = cache
+        self._fetch = fetch
+        self.budget = budget
+        self._ttl = ttl_seconds
+        self._interval = interval
+        self._lead = lead_seconds
+        self._jitter = jitter_seconds
+        self._semaphore = asyncio.Semaphore(concurrency)
+        self._half_life = half_life
+        self._min_score = min_score
+        self._cold_after = cold_after
+        self._max_tiles = max_tiles
+        self._max_backoff = max_backoff
+
+        self._tiles: Dict[str, _Tile] = {}
+        # Running refresh per cache key; resolves to the fetched data or None
+        self._in_flight: Dict[str, asyncio.Task] = {}
+        # Keys whose refresh holds a concurrency slot, i.e. is calling upstream
+        self._started: Set[str] = set()
+        # Cache keys whose current entry was written by prefetch
+        self._prefetched: Set[str] = set()
+
+        self._requests = 0
+        self._misses = 0
+        self._prefetch_hits = 0
+        self._prefetches = 0
+        self._prefetch_errors = 0
+        self._skipped_budget = 0
+
+    # ─── Request tracking (called by the /weather router) ─────
+
+    def record_request(self, key: str, lat: float, lng: float, hit: bool) -> None:
+        """Note a /weather request for a tile and whether the cache answered it."""
+        self._requests += 1
+        if not hit:
+            self._misses += 1
+        elif key in self._prefetched:
+            self._prefetch_hits += 1
+
+        # Tiles are only tracked while the scheduler is running to prune them
+        if not self.enabled:
+            return
+        now = time.time()
+        tile = self._tiles.get(key)
+        if tile is None:
+            tile = self._tiles[key] = _Tile(lat=lat, lng=lng, last_seen=now)
+        tile.score = self._decayed(tile, now) + 1
+        tile.last_seen = now
+
+    def record_fetch(self, key: str) -> None:
+        """Note that a user request fetched and cached this tile itself."""
+        self._prefetched.discard(key)
+        tile = self._tiles.get(key)
+        if tile is not None:
+            tile.jitter = random.uniform(0, self._jitter)
+            tile.deferred = False
+
+    async def wait_in_flight(self, key: str) -> Optional[dict]:
+        """
+        If a refresh for this key is already calling upstream, wait for it and
+        return its data. Returns None if none is running, it is still queued
+        behind other refreshes, or it failed/was cancelled — the caller then
+        fetches itself.
+        """
+        task = self._in_flight.get(key)
+        if task is None or key not in self._started:
+            return None
+        try:
+            # Shield so a disconnecting client doesn't cancel the shared refresh
+            return await asyncio.shield(task)
+        except asyncio.CancelledError:
+            if task.cancelled():
+                return None  # refresh cancelled (shutdown), not this request
+            raise
+
+    def _decayed(self, tile: _Tile, now: float) -> float:
+        return tile.score * 0.5 ** ((now - tile.last_seen) / self._half_life)
+
+    # ─── Scheduler ────────────────────────────────────────────
+
+    async def run(self) -> None:
+        """Scheduler loop; run as a background task for the app's lifetime."""
+        try:
+            while True:
+                await asyncio.sleep(self._interval)
+                self._tick()
+        finally:
+            for task in list(self._in_flight.values()):
+                task.cancel()
+
+    def _tick(self) -> None:
+        now = time.time()
+        self._drop_cold(now)
+
+        due = []
+        for key, tile in self._tiles.items():
+            if key in self._in_flight or now < tile.next_attempt:
+                continue
+            if self._decayed(tile, now) < self._min_score:
+                continue
+            remaining = self._cache.expires_in(key)
+            if remaining is None or remaining <= self._lead + tile.jitter:
+                due.append(key)
+
+        # Hottest tiles first, so a tight budget goes where it matters most
+        due.sort(key=lambda k: self._decayed(self._tiles[k], now), reverse=True)
+        for i, key in enumerate(due):
+            if not self.budget.try_acquire():
+                # Count each cache entry once, not once per tick it stays deferred
+                for skipped in due[i:]:
+                    tile = self._tiles[skipped]
+                    if not tile.deferred:
+                        tile.deferred = True
+                        self._skipped_budget += 1
+                break
+            self._in_flight[key] = asyncio.create_task(self._refresh(key))
+
+    def _drop_cold(self, now: float) -> None:
+        cold = {
+            key for key, tile in self._tiles.items()
+            if now - tile.last_seen > self._cold_after
+        }
+        # Also cap memory: keep only the hottest max_tiles
+        overflow = len(self._tiles) - len(cold) - self._max_tiles
+        if overflow > 0:
+            warm = sorted(
+                (k for k in self._tiles if k not in cold),
+                key=lambda k: self._decayed(self._tiles[k], now),
+            )
+            cold.update(warm[:overflow])
+        for key in cold:
+            del self._tiles[key]
+            self._prefetched.discard(key)
+
+    async def _refresh(self, key: str) -> Optional[dict]:
+        tile = self._tiles.get(key)
+        try:
+            if tile is None:
+                return None
+            async with self._semaphore:
+                self._started.add(key)
+                data = await self._fetch(tile.lat, tile.lng)
+            self._cache.set(key, data, ttl_seconds=self._ttl)
+            self._prefetched.add(key)
+            tile.jitter = random.uniform(0, self._jitter)
+            tile.failures = 0
+            tile.next_attempt = 0.0
+            tile.deferred = False
+            self._prefetches += 1
+            return data
+        except Exception:
+            self._prefetch_errors += 1
+            # Exponential backoff with jitter so a failing (or rate-limiting)
+            # upstream isn't hit again on every tick
+            tile.failures += 1
+            delay = min(self._max_backoff, self._interval * 2 ** tile.failures)
+            tile.next_attempt = time.time() + delay * random.uniform(0.5, 1.0)
+            logger.warning("Weather prefetch failed for tile %s", key, exc_info=True)
+            return None
+        finally:
+            self._in_flight.pop(key, None)
+            self._started.discard(key)
+
+    # ─── Reporting ────────────────────────────────────────────
+
+    def stats(self) -> dict:
+        """Counters for prefetch effectiveness and upstream budget usage."""
+        return {
+            "enabled": self.enabled,
+            "tracked_tiles": len(self._tiles),
+            "requests": self._requests,
+            "misses": self._misses,
+            "prefetch_hits": self._prefetch_hits,
+            "prefetch_hit_ratio": round(self._prefetch_hits / self._requests, 3) if self._requests else 0.0,
+            "prefetches": self._prefetches,
+            "prefetch_errors": self._prefetch_errors,
+            "skipped_for_budget": self._skipped_budget,
+            "budget_per_minute": self.budget.per_minute,
+            "budget_used_last_minute": self.budget.used(),
+        }
@@ -0,0 +1,60 @@
+"""
+Local mock of the OpenWeatherMap current-weather API.
+Lets the weather prefetcher be exercised without a real API key.
+
+Run with: uvicorn utils.mock_upstream:app --port 9000
+Then start the backend with:
+    OPENWEATHER_API_KEY=mock OPENWEATHER_BASE_URL=http://localhost:9000
+
+Responses are delayed by MOCK_LATENCY_MS (default 300) to mimic a slow
+upstream, and calls beyond MOCK_RPM (default 60) per minute get HTTP 429.
+GET /stats reports how many calls were received and rejected.
+"""
+
+import asyncio
+import os
+import random
+import time
+from collections import deque
+
+from fastapi import FastAPI, HTTPException, Query
+
+app = FastAPI(title="Mock OpenWeather")
+
+_LATENCY = float(os.environ.get("MOCK_LATENCY_MS", "300")) / 1000
+_RPM = int(os.environ.get("MOCK_RPM", "60"))
+
+_window = deque()
+_stats = {"calls": 0, "rejected": 0}
+
+
+@app.get("/data/2.5/weather")
+async def current_weather(
+    lat: float = Query(...),
+    lon: float = Query(...),
+    appid: str = Query(...),
+    units: str = Query("metric"),
+):
+    """Return an OpenWeather-shaped payload after a simulated delay."""
+    now = time.time()
+    while _window and _window[0] <= now - 60:
+        _window.popleft()
+    _stats["calls"] += 1
+    if len(_window) >= _RPM:
+        _stats["rejected"] += 1
+        raise HTTPException(status_code=429, detail="Rate limit exceeded")
+    _window.append(now)
+
+    await asyncio.sleep(_LATENCY)
+    return {
+        "coord": {"lat": lat, "lon": lon},
+        "main": {"temp": random.uniform(24, 36), "humidity": random.randint(40, 85)},
+        "clouds": {"all": random.randint(0, 100)},
+        "weather": [{"main": random.choice(["Clear", "Clouds", "Rain"])}],
+    }
+
+
+@app.get("/stats")
+async def stats():
+    """Calls received in total, and how many were rate-limited."""
+    return {**_stats, "calls_last_minute": len(_window)}